@@ -10,7 +10,9 @@ from .Universe import Universe
 from .Position import Position
 
 
-class Agent(threading.Thread):  # TODO make this ABC
+class Agent:  # TODO make this ABC
+    # Lightweight agent: plain object whose rounds are submitted to the
+    # universe's scheduler instead of running on a dedicated OS thread
     def __init__(
         self,
         universe: Universe,
@@ -21,11 +23,8 @@ class Agent(threading.Thread):  # TODO make this ABC
         phenome: Phenome = None,
         start_date: int = None,
         start_on_birth: bool = False,
-        start_barrier: threading.Barrier = None,
         debug: bool = False,
     ):
-        super().__init__()
-        self.daemon = True
         self.debug = debug
 
         # Agent properties
@@ -36,7 +35,7 @@ class Agent(threading.Thread):  # TODO make this ABC
             self.id = len(universe.population)
             universe.population[self.id] = self
         self.stop = threading.Event()
-        self.start_barrier = start_barrier
+        self.started = False
 
         # Constants
         self.initial_phenome = phenome if phenome is not None else Phenome()
@@ -51,6 +50,10 @@ class Agent(threading.Thread):  # TODO make this ABC
         self.energy = energy if energy else self.phenome.energy_capacity
         self.position = initial_position
         self.path = []  # remove and post-compute with actions
+        # SoA replay arrays, built once by finalize_path after the simulation
+        self.path_t = None
+        self.path_y = None
+        self.path_x = None
         self.actions: list = []
         self.children = []
 
@@ -82,9 +85,10 @@ class Agent(threading.Thread):  # TODO make this ABC
         if self.debug:
             print(f"Agent {self.id} initialized by {parents}")
 
-    def run(self):
-        if self.start_barrier:
-            self.start_barrier.wait()
+    def start(self):
+        # Marks the agent as schedulable; kept as a method so start_on_birth
+        # and _start_initial_population keep their API
+        self.started = True
         self.start_date = self.universe.get_time()
         self.actions.append(
             {
@@ -100,64 +104,64 @@ class Agent(threading.Thread):  # TODO make this ABC
         if self.debug:
             print(f"Agent {self.id} start running")
 
-        # Lifetime
-        while not self.stop.is_set() and not self.universe.freeze.is_set():
-            # Minimal energy loss
-            self.energy -= 3
+    def step(self):
+        # One round of the agent's lifetime, scheduled by the universe
+        if self.stop.is_set() or self.universe.freeze.is_set():
+            return
 
-            # Reaction time set up to set agents speed dependent of their phenome instead of
-            # the CPU core its thread is running on
-            sleep(self.phenome.reaction_time)  # TODO rework
-            reaction_time = self.universe.get_time()
+        # Minimal energy loss
+        self.energy -= 3
 
-            # Decision making taking into account environment and self
-            decision = self.phenome.brain(
-                self.universe.get_area(self.position, self.phenome.scope)
-            )
-            decision_time = self.universe.get_time()
-
-            # Decision -> Action
-            action_success = False
-            match decision:
-                case Abilities.idle:
-                    action_success, action_time = self.idle()
-                case Abilities.move_bot:
-                    action_success, action_time = self.move(Position(1, 0))
-                case Abilities.move_top:
-                    action_success, action_time = self.move(Position(-1, 0))
-                case Abilities.move_left:
-                    action_success, action_time = self.move(Position(0, -1))
-                case Abilities.move_right:
-                    action_success, action_time = self.move(Position(0, 1))
-                case Abilities.eat_bot:
-                    action_success, action_time = self.eat(Position(1, 0))
-                case Abilities.eat_top:
-                    action_success, action_time = self.eat(Position(-1, 0))
-                case Abilities.eat_left:
-                    action_success, action_time = self.eat(Position(0, -1))
-                case Abilities.eat_right:
-                    action_success, action_time = self.eat(Position(0, 1))
-                case Abilities.reproduce:
-                    action_success, action_time = self.reproduce()
+        # Reaction time set up to set agents speed dependent of their phenome instead of
+        # the CPU core its round is running on
+        sleep(self.phenome.reaction_time)  # TODO rework
+        reaction_time = self.universe.get_time()
 
-            self.actions.append(
-                {
-                    "id": self.id,
-                    # "reaction_time": reaction_time,
-                    # "decision_time": decision_time,
-                    "decision": decision.value,
-                    "action_time": action_time,
-                    "action_success": action_success,
-                }
-            )
+        # Decision making taking into account environment and self
+        decision = self.phenome.brain(
+            self.universe.get_area(self.position, self.phenome.scope)
+        )
+        decision_time = self.universe.get_time()
+
+        # Decision -> Action
+        action_success = False
+        match decision:
+            case Abilities.idle:
+                action_success, action_time = self.idle()
+            case Abilities.move_bot:
+                action_success, action_time = self.move(Position(1, 0))
+            case Abilities.move_top:
+                action_success, action_time = self.move(Position(-1, 0))
+            case Abilities.move_left:
+                action_success, action_time = self.move(Position(0, -1))
+            case Abilities.move_right:
+                action_success, action_time = self.move(Position(0, 1))
+            case Abilities.eat_bot:
+                action_success, action_time = self.eat(Position(1, 0))
+            case Abilities.eat_top:
+                action_success, action_time = self.eat(Position(-1, 0))
+            case Abilities.eat_left:
+                action_success, action_time = self.eat(Position(0, -1))
+            case Abilities.eat_right:
+                action_success, action_time = self.eat(Position(0, 1))
+            case Abilities.reproduce:
+                action_success, action_time = self.reproduce()
 
-            # Energy boundings
-            if self.energy < 1:
-                self.die()
-            self.energy = min(self.energy, self.phenome.energy_capacity)
+        self.actions.append(
+            {
+                "id": self.id,
+                # "reaction_time": reaction_time,
+                # "decision_time": decision_time,
+                "decision": decision.value,
+                "action_time": action_time,
+                "action_success": action_success,
+            }
+        )
 
-        # Stop the agent for monitoring
-        self.stop.set()
+        # Energy boundings
+        if self.energy < 1:
+            self.die()
+        self.energy = min(self.energy, self.phenome.energy_capacity)
 
     # SIMULATION
     def idle(self) -> tuple[bool, int]:
@@ -253,6 +257,14 @@ class Agent(threading.Thread):  # TODO make this ABC
             print(f"Agent {self.id} died")
 
     # UTILITIES
+    def finalize_path(self):
+        # Converts the recorded path to SoA NumPy arrays so replays can
+        # advance with np.searchsorted instead of walking Position objects
+        if self.path_t is None:
+            self.path_t = np.fromiter((t for t, _ in self.path), dtype=np.float64)
+            self.path_y = np.fromiter((p.y for _, p in self.path), dtype=np.int32)
+            self.path_x = np.fromiter((p.x for _, p in self.path), dtype=np.int32)
+
     def copy(self):
         # TODO
         pass
@@ -277,10 +289,9 @@ class Agent(threading.Thread):  # TODO make this ABC
         data["actions_count"] = len(self.actions)
 
         decision_durations = [
-            b - a
-            for b, a in zip(
-                self.actions["decision_time"], self.actions["reaction_time"]
-            )
+            a["decision_time"] - a["reaction_time"]
+            for a in self.actions
+            if "decision_time" in a and "reaction_time" in a
         ]
         data["min_decision_duration"] = (
             None if len(decision_durations) < 1 else min(decision_durations)
@@ -303,8 +314,9 @@ class Agent(threading.Thread):  # TODO make this ABC
         )
 
         action_durations = [
-            b - a
-            for b, a in zip(self.actions["action_time"], self.actions["decision_time"])
+            a["action_time"] - a["decision_time"]
+            for a in self.actions
+            if "decision_time" in a
         ]
         data["min_action_duration"] = (
             None if len(action_durations) < 1 else min(action_durations)
@@ -323,7 +335,7 @@ class Agent(threading.Thread):  # TODO make this ABC
         )
 
         # Meta-data
-        round_timers = [a for a in self.actions["action_time"]]
+        round_timers = [a["action_time"] for a in self.actions]
         round_durations = [
             round_timers[i + 1] - round_timers[i] for i in range(len(round_timers) - 1)
         ]
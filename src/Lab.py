@@ -1,23 +1,88 @@
-import threading
+import traceback
 import numpy as np
 import pandas as pd
+from concurrent.futures import wait
 from random import randint
-from time import sleep
+from time import monotonic_ns
 from matplotlib import pyplot as plt
 import seaborn as sns
 from math import ceil
 from enum import Enum
 from tqdm import tqdm
 
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 from .Universe import Universe
 from .Agent import Agent
 from .Position import Position
 
+# Below this population size the JIT dispatch overhead outweighs the
+# compiled loop, so the plain NumPy path is used instead
+NUMBA_MIN_AGENTS = 1024
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, parallel=True)
+    def _aggregate_metrics(values):
+        # values: (agents, metrics) float64 with NaN for missing data.
+        # Returns (metrics, 5) rows of min/max/mean/median/std, computed in
+        # one fused pass per metric (Welford for mean/std, sort for median)
+        metrics_count = values.shape[1]
+        out = np.full((metrics_count, 5), np.nan)
+        for j in prange(metrics_count):
+            col = values[:, j]
+            col = col[~np.isnan(col)]
+            n = col.size
+            if n == 0:
+                continue
+            vmin = col[0]
+            vmax = col[0]
+            mean = 0.0
+            m2 = 0.0
+            for k in range(n):
+                v = col[k]
+                if v < vmin:
+                    vmin = v
+                if v > vmax:
+                    vmax = v
+                delta = v - mean
+                mean += delta / (k + 1)
+                m2 += delta * (v - mean)
+            col = np.sort(col)
+            if n % 2:
+                median = col[n // 2]
+            else:
+                median = 0.5 * (col[n // 2 - 1] + col[n // 2])
+            out[j, 0] = vmin
+            out[j, 1] = vmax
+            out[j, 2] = mean
+            out[j, 3] = median
+            out[j, 4] = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+        return out
+
+    @njit(cache=True, parallel=True)
+    def _rasterize(frame, spawn_ts, death_ts, ys, xs, colors, time):
+        for i in prange(len(spawn_ts)):
+            if spawn_ts[i] <= time < death_ts[i]:
+                for c in range(3):
+                    frame[ys[i], xs[i], c] = colors[i, c]
+
 
 class Distributions(Enum):
     random = "random"
 
 
+def _maybe_tqdm(iterable, verbose: bool, **kwargs):
+    # tqdm(disable=True) still allocates the wrapper and dispatches __next__
+    # on every iteration; skip it entirely when not verbose
+    return tqdm(iterable, **kwargs) if verbose else iterable
+
+
 class Lab:
     # SIMULATION
     def experiment(
@@ -54,12 +119,11 @@ class Lab:
             universe, height, width, initial_population_count, verbose
         )
         assert (
-            np.sum(universe.space != None) == initial_population_count
+            int(universe.occupied.sum()) == initial_population_count
         )  # Positions are uniques
         timings["invoke_initial_population"] = universe.get_time()
 
         # Start population
-        non_agents_threads = threading.active_count()
         self._start_initial_population(universe, verbose)
         timings["start_initial_population"] = universe.get_time()
 
@@ -68,33 +132,48 @@ class Lab:
         start_running = universe.get_time()
         total_duration_remaining = max_total_duration - max(0, int(start_running / 1e9))
         simulation_duration = min(total_duration_remaining, max_simulation_duration)
-        for i in tqdm(
-            range(simulation_duration, 0, -1),
+        # Wall-clock pacing only needs the monotonic clock: universe time is
+        # read once per phase instead of on every tick
+        run_start_ns = monotonic_ns()
+        deadline_ns = run_start_ns + int(simulation_duration * 1e9)
+        progress = tqdm(
+            total=simulation_duration,
             desc="Running simulation\t",
             disable=not verbose,
             colour="yellow",
-        ):
-            if threading.active_count() <= non_agents_threads:
+        )
+        alive = [
+            a for a in universe.population.values() if a.started and not a.stop.is_set()
+        ]
+        while monotonic_ns() < deadline_ns:
+            if not alive:
                 if verbose:
                     print(f"Simulation early stop\t: All entities died.")
                 early_stop = True
                 break
-            t = (universe.get_time() - start_running) / 1e9  # Avoiding time drift
-            sleep(max(1 + simulation_duration - i - t, 0))
+            # One scheduling tick: every live agent performs one round
+            futures = [universe.scheduler.submit(agent.step) for agent in alive]
+            wait(futures)
+            for agent, future in zip(alive, futures):
+                error = future.exception()
+                if error is not None:
+                    # A crashed agent leaves the schedule instead of being
+                    # silently resubmitted broken on every tick
+                    agent.stop.set()
+                    print(f"Agent {agent.id} failed\t:")
+                    traceback.print_exception(error)
+            with universe.population_lock:
+                agents = list(universe.population.values())
+            alive = [a for a in agents if a.started and not a.stop.is_set()]
+            elapsed = int((monotonic_ns() - run_start_ns) / 1e9)
+            if elapsed > progress.n:
+                progress.update(min(elapsed, simulation_duration) - progress.n)
+        progress.close()
         timings["run"] = universe.get_time()
 
         # Stop
         universe.freeze.set()
-        first_iteration = True
-        active_agents = threading.active_count() - non_agents_threads
-        while active_agents > 0:
-            if first_iteration:
-                print(f"Interrupting population\t: {active_agents}...")
-                first_iteration = False
-            else:
-                print(f"\t\t\t| {active_agents}...")
-            sleep(1e-1)
-            active_agents = threading.active_count() - non_agents_threads
+        universe.scheduler.shutdown(wait=True)
         universe.culmination = universe.get_time()
         timings["stop"] = universe.culmination
 
@@ -105,12 +184,39 @@ class Lab:
 
         return {"parameters": parameters, "timings": timings, "universe": universe}
 
-    def _generate_position(self, positions: list[Position], height: int, width: int):
-        new_pos = Position(y=randint(0, height - 1), x=randint(0, width - 1))
-        if new_pos not in positions:
-            return new_pos
-        else:
-            return self._generate_position(positions, height, width)
+    def _generate_position(
+        self, positions_set: set, height: int, width: int
+    ) -> Position:
+        # Iterative rejection with O(1) set membership: no recursion, so a
+        # near-full grid cannot hit the interpreter stack limit
+        _randint = randint  # Local binding keeps the retry loop on LOAD_FAST
+        while True:
+            cell = (_randint(0, height - 1), _randint(0, width - 1))
+            if cell not in positions_set:
+                positions_set.add(cell)
+                return Position(y=cell[0], x=cell[1])
+
+    # Below this population density, set-based rejection sampling rarely
+    # collides and beats shuffling the whole grid
+    REJECTION_SAMPLING_MAX_DENSITY = 0.3
+
+    def _generate_positions(
+        self, height: int, width: int, count: int, verbose: bool = False
+    ) -> list[Position]:
+        density = count / (height * width)
+        if density < self.REJECTION_SAMPLING_MAX_DENSITY:
+            if verbose:
+                print(f"Sampling positions\t: rejection (density {density:.2f})")
+            positions_set = set()
+            generate_position = self._generate_position
+            return [
+                generate_position(positions_set, height, width) for _ in range(count)
+            ]
+        if verbose:
+            print(f"Sampling positions\t: permutation (density {density:.2f})")
+        indices = np.random.default_rng().permutation(height * width)[:count]
+        ys, xs = np.divmod(indices, width)
+        return [Position(y=int(y), x=int(x)) for y, x in zip(ys, xs)]
 
     def _invoke_initial_population(
         self,
@@ -121,38 +227,30 @@ class Lab:
         verbose: bool,
         distribution: Distributions = Distributions.random,
     ) -> None:
-        positions = []
-        match distribution:
-            case Distributions.random:
-                for _ in tqdm(
-                    range(initial_population_count),
-                    desc="Generating positions\t",
-                    disable=not verbose,
-                    colour="magenta",
-                ):
-                    positions.append(self._generate_position(positions, height, width))
-            case _:
-                raise ValueError(
-                    f"Possible distributions: {[d.name for d in Distributions]}"
-                )
-        start_barrier = threading.Barrier(parties=initial_population_count)
-        for pos in tqdm(
-            positions, "Invoking population\t", disable=not verbose, colour="blue"
+        samplers = {Distributions.random: self._generate_positions}
+        if distribution not in samplers:
+            raise ValueError(
+                f"Possible distributions: {[d.name for d in Distributions]}"
+            )
+        positions = samplers[distribution](
+            height, width, initial_population_count, verbose
+        )
+        for pos in _maybe_tqdm(
+            positions, verbose, desc="Invoking population\t", colour="blue"
         ):
             Agent(
                 universe=universe,
                 initial_position=pos,
                 generation=0,
                 parents=["universe"],
-                start_barrier=start_barrier,
             )
 
     def _start_initial_population(self, universe, verbose: bool) -> None:
         with universe.population_lock:
-            for agent in tqdm(
+            for agent in _maybe_tqdm(
                 universe.population.values(),
+                verbose,
                 desc="Starting population\t",
-                disable=not verbose,
                 colour="green",
             ):
                 agent.start()
@@ -160,10 +258,10 @@ class Lab:
     def _stop_population(self, universe, verbose: bool) -> None:
         # For the moment it is unused, but to enable universe to unfreeze, it'll be needed
         with universe.population_lock:  # TODO Add priority to this lock
-            for agent in tqdm(
+            for agent in _maybe_tqdm(
                 universe.population.values(),
+                verbose,
                 desc="Stopping population\t",
-                disable=not verbose,
                 colour="red",
             ):
                 agent.stop.set()
@@ -172,17 +270,51 @@ class Lab:
     def get_statistics(self, simulation: dict, verbose: bool = True) -> dict:
         # TODO copy the universe to not alter it
         # Individuals statistics
-        agents_statistics = []
-        for a_id, agent in tqdm(
-            simulation["universe"].population.items(),
-            desc="Computing agents statistics\t",
-            disable=not verbose,
-            colour="red",
-        ):
-            agents_statistics.append(agent.get_data())
+        # Streamed into preallocated typed buffers: one DataFrame build with
+        # no per-row dict list and no dtype inference
+        population = simulation["universe"].population
+        agents_count = len(population)
+        int_columns = [
+            "generation",
+            "parents_count",
+            "children_count",
+            "travelled_distance",
+            "actions_count",
+        ]
+        bool_columns = ["dead", "birth_success"]
+        float_columns = ["lifespan"] + [
+            f"{stat}_{kind}_duration"
+            for kind in ("decision", "action", "round")
+            for stat in ("min", "max", "mean", "median", "std")
+        ]
+        ids = np.empty(agents_count, dtype=np.int64)
+        columns = {name: np.empty(agents_count, dtype=np.int64) for name in int_columns}
+        columns.update(
+            {name: np.empty(agents_count, dtype=bool) for name in bool_columns}
+        )
+        columns.update(
+            {name: np.empty(agents_count, dtype=np.float64) for name in float_columns}
+        )
 
-        agents_statistics_df = pd.DataFrame(agents_statistics)
-        agents_statistics_df.set_index("id", inplace=True)
+        for i, agent in enumerate(
+            _maybe_tqdm(
+                population.values(),
+                verbose,
+                desc="Computing agents statistics\t",
+                colour="red",
+            )
+        ):
+            data = agent.get_data()
+            ids[i] = data["id"]
+            for name in int_columns:
+                columns[name][i] = data[name]
+            for name in bool_columns:
+                columns[name][i] = data[name]
+            for name in float_columns:
+                value = data[name]
+                columns[name][i] = np.nan if value is None else value
+
+        agents_statistics_df = pd.DataFrame(columns, index=pd.Index(ids, name="id"))
 
         # Population statistics
         computed_data = [
@@ -195,20 +327,22 @@ class Lab:
             "mean_action_duration",
             "mean_round_duration",
         ]
-        population_statistics = []
-        for cp in computed_data:
-            population_statistics.append(
-                {
-                    "data": cp,
-                    "min": agents_statistics_df[cp].min(),
-                    "max": agents_statistics_df[cp].max(),
-                    "mean": agents_statistics_df[cp].mean(),
-                    "median": agents_statistics_df[cp].median(),
-                    "std": agents_statistics_df[cp].std(),
-                }
+        # Single fused pass over all metrics instead of one reduction per
+        # cell; JIT dispatch is only worth it for large populations
+        if NUMBA_AVAILABLE and len(agents_statistics_df) >= NUMBA_MIN_AGENTS:
+            population_statistics_df = pd.DataFrame(
+                _aggregate_metrics(
+                    agents_statistics_df[computed_data].to_numpy(dtype=np.float64)
+                ),
+                index=pd.Index(computed_data, name="data"),
+                columns=["min", "max", "mean", "median", "std"],
+            )
+        else:
+            population_statistics_df = (
+                agents_statistics_df[computed_data]
+                .agg(["min", "max", "mean", "median", "std"])
+                .T.rename_axis("data")
             )
-        population_statistics_df = pd.DataFrame(population_statistics)
-        population_statistics_df.set_index("data", inplace=True)
 
         return {
             "agents_statistics": agents_statistics_df,
@@ -252,46 +386,57 @@ class Lab:
 
         compressed_pos = []
         timestamps = []
-        next_moves = [
-            a.path[0][0] for a in simulation["universe"].population.values() if a.path
-        ]
+        population = simulation["universe"].population
+        # Per-agent cursors into the paths: replaying no longer consumes
+        # agent.path with O(len(path)) pop(0) nor mutates agent.position
+        cursors = {a.id: 0 for a in population.values()}
+        positions = {a.id: a.position for a in population.values()}
+        next_moves = [a.path[0][0] for a in population.values() if a.path]
         next_timestamp = None if not next_moves else min(next_moves)
-        disabled_agents = [a for a in simulation["universe"].population.values()]
+        disabled_agents = [a for a in population.values()]
         enabled_agents = []
 
         while next_timestamp < float("inf"):
             # Timestamp
             timestamps.append(next_timestamp)
             next_moves = [
-                a.path[1][0]
-                for a in simulation["universe"].population.values()
-                if len(a.path) >= 2
+                a.path[cursors[a.id] + 1][0]
+                for a in population.values()
+                if len(a.path) - cursors[a.id] >= 2
             ]
             next_timestamp = float("inf") if not next_moves else min(next_moves)
 
             # Enabling agents
-            next_disabled_agents = [a for a in disabled_agents]
+            still_disabled_agents = []
             for a in disabled_agents:
-                if a.path and a.path[0][0] < next_timestamp:
+                if (
+                    cursors[a.id] < len(a.path)
+                    and a.path[cursors[a.id]][0] < next_timestamp
+                ):
                     enabled_agents.append(a)
-                    next_disabled_agents.remove(a)
-            disabled_agents = next_disabled_agents
+                else:
+                    still_disabled_agents.append(a)
+            disabled_agents = still_disabled_agents
 
             # Updating enabled positions
-            next_enabled_agents = [a for a in enabled_agents]
+            still_enabled_agents = []
             for a in enabled_agents:
                 # TODO Dead ones can disapear before their last move
                 if a.death_date and a.death_date < next_timestamp:
-                    next_enabled_agents.remove(a)
-                elif a.path and a.path[0][0] < next_timestamp:
-                    a.position = a.path[0][1]
-                    a.path.pop(0)
-            enabled_agents = next_enabled_agents
+                    continue
+                if (
+                    cursors[a.id] < len(a.path)
+                    and a.path[cursors[a.id]][0] < next_timestamp
+                ):
+                    positions[a.id] = a.path[cursors[a.id]][1]
+                    cursors[a.id] += 1
+                still_enabled_agents.append(a)
+            enabled_agents = still_enabled_agents
 
             # Create frame with enabled agents
             frame_positions = {}
             for a in enabled_agents:
-                frame_positions[a.id] = (a.position.y, a.position.x)
+                frame_positions[a.id] = (positions[a.id].y, positions[a.id].x)
             compressed_pos.append(frame_positions)
 
         # Create a single struct with compressed positions and timestamps
@@ -313,6 +458,45 @@ class Lab:
         return agents_data
 
     # VISUALIZATION
+    def generate_actions_timeline(self, simulation, frames_count: int = 100):
+        # Yields (height, width, 3) uint8 frames replaying the recorded paths.
+        # Each frame is rasterized with a single fancy-indexed scatter instead
+        # of one Python-level write per agent.
+        universe = simulation["universe"]
+        agents = [a for a in universe.population.values() if a.path]
+        for agent in agents:
+            agent.finalize_path()
+        spawn_ts = np.fromiter((a.path_t[0] for a in agents), dtype=np.float64)
+        death_ts = np.fromiter(
+            (a.death_date if a.death_date else np.inf for a in agents),
+            dtype=np.float64,
+        )
+        ys = np.fromiter((a.path_y[0] for a in agents), dtype=np.int32)
+        xs = np.fromiter((a.path_x[0] for a in agents), dtype=np.int32)
+        colors = (
+            np.stack([universe.get_phenome_color(a.phenome) for a in agents])
+            if agents
+            else np.empty((0, 3), dtype=np.uint8)
+        )
+        cursors = [0] * len(agents)
+
+        frame = np.ones((universe.height, universe.width, 3), dtype=np.uint8)
+        for time in np.linspace(0, universe.culmination, num=frames_count):
+            # Advance each agent along its path up to the current frame time
+            for i, agent in enumerate(agents):
+                cursor = np.searchsorted(agent.path_t, time, side="right") - 1
+                if cursor > cursors[i]:
+                    cursors[i] = cursor
+                    ys[i] = agent.path_y[cursor]
+                    xs[i] = agent.path_x[cursor]
+            frame[...] = 1
+            if NUMBA_AVAILABLE and len(agents) >= NUMBA_MIN_AGENTS:
+                _rasterize(frame, spawn_ts, death_ts, ys, xs, colors, time)
+            else:
+                visible = (spawn_ts <= time) & (time < death_ts)
+                frame[ys[visible], xs[visible]] = colors[visible]
+            yield frame
+
     def plot_generation_stats(self, data):
         # Set up subplots
         fig, axes = plt.subplots(2, 3, figsize=(14, 10))
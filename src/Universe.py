@@ -1,5 +1,7 @@
+import os
 import threading
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from time import perf_counter_ns
 
 from .Position import Position
@@ -23,6 +25,9 @@ class Universe:
         self.space: np.array = np.full(
             shape=(self.height, self.width), fill_value=None, dtype=object
         )
+        # Boolean mirror of the space, so occupancy queries scan one byte
+        # per cell instead of comparing PyObject pointers
+        self.occupied: np.array = np.zeros(shape=(self.height, self.width), dtype=bool)
         self.space_locks: np.array = np.empty(
             shape=(self.height, self.width), dtype=object
         )
@@ -31,8 +36,16 @@ class Universe:
                 self.space_locks[y, x] = threading.Lock()
 
         # Population
+        # Agents are plain objects; their rounds are scheduled on a bounded
+        # pool instead of one OS thread per agent
         self.population: dict = {}
         self.population_lock: threading.Lock = threading.Lock()
+        self.scheduler: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=os.cpu_count()
+        )
+        # Phenome colors repeat across lineages (copy() preserves them), so
+        # displayable rows are cached per color tuple
+        self.color_table: dict = {}
 
     def wrap_position(self, pos: Position):
         # Used on every pos input
@@ -45,7 +58,7 @@ class Universe:
     ):  # TODO rename or refactor (stop returning bool or pos)
         pos = self.wrap_position(pos)
         return (
-            pos if not self.freeze.is_set() and self.space[pos.tuple] is None else False
+            pos if not self.freeze.is_set() and not self.occupied[pos.tuple] else False
         )
 
     def get_area(self, pos: Position, scope: int) -> np.array:
@@ -105,9 +118,20 @@ class Universe:
             pos.x - scope + left_overflow : pos.x + scope + 1 + left_overflow,
         ]
 
+    def free_cells(self) -> np.array:
+        # Flat indices (y * width + x) of the unoccupied cells
+        return np.flatnonzero(~self.occupied)
+
     def get_time(self) -> int:
         return perf_counter_ns() - self.genesis
 
+    def get_phenome_color(self, phenome) -> np.array:
+        color = self.color_table.get(phenome.color)
+        if color is None:
+            color = np.asarray(phenome.color, dtype=np.uint8)
+            self.color_table[phenome.color] = color
+        return color
+
     def get_displayable(self):
         displayable_array: np.array = np.vectorize(
             lambda agent: (1 + agent.id) % 255 if agent is not None else 0,
@@ -131,9 +155,9 @@ class Universe:
 
     def __setitem__(self, pos: Position, value: object):
         if isinstance(pos, Position):
-            self.space[pos.tuple] = value
-        else:
-            self.space[pos] = value
+            pos = pos.tuple
+        self.space[pos] = value
+        self.occupied[pos] = value is not None
 
     def __eq__(self, other):
         return self.space == other